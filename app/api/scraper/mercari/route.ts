@@ -52,6 +52,9 @@ const API_VERSION = '2.0';
 const DEFAULT_LIMIT = 20;
 const MAX_LIMIT = 50;
 
+// Upper bound on a single Mercari request so a stalled socket cannot hang the scan
+const API_TIMEOUT_MS = 10_000;
+
 // Supported categories on Mercari
 const SUPPORTED_CATEGORIES = [
   { id: '1', label: 'Women' },
@@ -169,6 +172,7 @@ async function callMercariApi(
     method,
     headers: buildMercariHeaders(),
     cache: 'no-store',
+    signal: AbortSignal.timeout(API_TIMEOUT_MS),
   };
 
   /* istanbul ignore next -- callMercariApi always called with POST+body in production */
@@ -263,10 +267,11 @@ async function scrapeMercariSearch(params: ScrapeRequestBody): Promise<MercariIt
     }
 
     // If API fails for other reasons, try web scraping as fallback
-    console.warn('Mercari API failed, attempting web scrape fallback');
+    console.warn(`Mercari API failed (${errorMsg}), attempting web scrape fallback`);
 
     const response = await fetch(url, {
       headers: buildMercariHeaders(),
+      signal: AbortSignal.timeout(API_TIMEOUT_MS),
     });
 
     if (!response.ok) {
@@ -333,15 +338,9 @@ function formatLocation(item: MercariItem): string | null {
  * Collects all image URLs from a Mercari item
  */
 function collectImageUrls(item: MercariItem): string[] {
-  const urls: string[] = [];
-
-  if (item.photos?.length) {
-    urls.push(...item.photos);
-  } else if (item.thumbnails?.length) {
-    urls.push(...item.thumbnails);
-  }
-
-  return urls.filter(Boolean);
+  // Filter straight from the source array; filter() already returns a fresh copy
+  const source = item.photos?.length ? item.photos : item.thumbnails;
+  return source ? source.filter(Boolean) : [];
 }
 
 /**
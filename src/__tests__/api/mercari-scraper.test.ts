@@ -625,6 +625,85 @@ describe('Mercari Scraper - additional branch coverage', () => {
       // Fallback returns [] (no items) → 200 with empty listings
       expect([200, 500]).toContain(response.status);
     });
+
+    it('bounds the API calls and the web scrape fallback with a timeout signal', async () => {
+      const failResponse = {
+        ok: false,
+        status: 500,
+        headers: { get: () => 'application/json' },
+        text: () => Promise.resolve('Server error'),
+        json: () => Promise.resolve({ message: 'Server error' }),
+      };
+      const fallbackOkResponse = {
+        ok: true,
+        text: () => Promise.resolve('<html>listings</html>'),
+        json: () => Promise.resolve({}),
+        headers: { get: () => 'text/html' },
+      };
+
+      // active API call, sold API call, active web scrape fallback
+      mockFetch
+        .mockResolvedValueOnce(failResponse)
+        .mockResolvedValueOnce(failResponse)
+        .mockResolvedValueOnce(fallbackOkResponse);
+
+      const request = new NextRequest('http://localhost:3000/api/scraper/mercari', {
+        method: 'POST',
+        body: JSON.stringify({ keywords: 'timeout test' }),
+      });
+
+      await POST(request);
+
+      expect(mockFetch).toHaveBeenCalledTimes(3);
+      for (const [, options] of mockFetch.mock.calls) {
+        expect(options.signal).toBeInstanceOf(AbortSignal);
+        expect(options.signal.aborted).toBe(false);
+      }
+    });
+
+    it('falls back to the web scrape when the API request times out', async () => {
+      const warnSpy = jest.spyOn(console, 'warn').mockImplementation(() => {});
+      const failResponse = {
+        ok: false,
+        status: 500,
+        headers: { get: () => 'application/json' },
+        text: () => Promise.resolve('Server error'),
+        json: () => Promise.resolve({ message: 'Server error' }),
+      };
+      const fallbackOkResponse = {
+        ok: true,
+        text: () => Promise.resolve('<html>listings</html>'),
+        json: () => Promise.resolve({}),
+        headers: { get: () => 'text/html' },
+      };
+
+      mockFetch
+        .mockRejectedValueOnce(new DOMException('timed out', 'TimeoutError')) // fetch #1: active API times out
+        .mockResolvedValueOnce(failResponse)       // fetch #2: sold API fails (caught internally)
+        .mockResolvedValueOnce(fallbackOkResponse); // fetch #3: web scrape fallback
+
+      const request = new NextRequest('http://localhost:3000/api/scraper/mercari', {
+        method: 'POST',
+        body: JSON.stringify({ keywords: 'timeout fallback test' }),
+      });
+
+      try {
+        const response = await POST(request);
+
+        // Wrapped as a generic fetch failure, not classified as a rate limit
+        expect(warnSpy).toHaveBeenCalledWith(
+          expect.stringContaining('Failed to fetch from Mercari: timed out')
+        );
+        expect(response.status).not.toBe(429);
+        expect(response.status).toBe(200);
+
+        expect(mockFetch).toHaveBeenCalledTimes(3);
+        expect(mockFetch.mock.calls[0][0]).toBe('https://www.mercari.com/v1/api/search');
+        expect(mockFetch.mock.calls[2][0]).toMatch(/^https:\/\/www\.mercari\.com\/search\/\?/);
+      } finally {
+        warnSpy.mockRestore();
+      }
+    });
   });
 });
 
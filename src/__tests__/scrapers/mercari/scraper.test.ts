@@ -158,6 +158,19 @@ describe('Mercari Scraper Module', () => {
       );
     });
 
+    it('bounds each API request with a timeout signal', async () => {
+      mockFetch.mockResolvedValueOnce({
+        ok: true,
+        json: () => Promise.resolve({ result: 'success', data: [] }),
+      });
+
+      await callMercariApi('/search', 'POST', { keyword: 'test' });
+
+      const [, options] = mockFetch.mock.calls[0];
+      expect(options.signal).toBeInstanceOf(AbortSignal);
+      expect(options.signal.aborted).toBe(false);
+    });
+
     it('returns parsed JSON response on success', async () => {
       const mockResponse = { result: 'success', data: [{ id: '1', name: 'Item' }] };
       mockFetch.mockResolvedValueOnce({
@@ -445,6 +458,32 @@ describe('Mercari Scraper Module', () => {
       );
     }, 30000);
 
+    it('falls back to Playwright without retrying when the API request times out', async () => {
+      mockFetch.mockRejectedValueOnce(new DOMException('timed out', 'TimeoutError'));
+
+      const mockPage = {
+        addInitScript: jest.fn(),
+        goto: jest.fn(),
+        waitForSelector: jest.fn().mockResolvedValue(undefined),
+        evaluate: jest
+          .fn()
+          .mockResolvedValue([{ id: 'pw-1', name: 'Playwright Item', price: 42 }]),
+      };
+      const mockContext = { newPage: jest.fn().mockResolvedValue(mockPage) };
+      chromium.launch.mockResolvedValue({
+        newContext: jest.fn().mockResolvedValue(mockContext),
+        close: jest.fn(),
+      });
+
+      const result = await scrapeMercariSearch({ keywords: 'switch' });
+
+      expect(mockFetch).toHaveBeenCalledTimes(1);
+      expect(chromium.launch).toHaveBeenCalledTimes(1);
+      expect(result).toEqual([
+        expect.objectContaining({ id: 'pw-1', name: 'Playwright Item', price: 42 }),
+      ]);
+    }, 30000);
+
     it('returns items from apiResponse.items when .data is absent', async () => {
       mockFetch.mockResolvedValueOnce({
         ok: true,
@@ -765,6 +804,15 @@ describe('Mercari Scraper Module', () => {
       const urls = collectImageUrls(item);
       expect(urls).toHaveLength(3);
     });
+
+    it('drops empty URLs without mutating or aliasing the source array', () => {
+      const photos = ['https://img1.jpg', '', 'https://img2.jpg'];
+      const item = createMercariItem({ photos });
+      const urls = collectImageUrls(item);
+      expect(urls).toEqual(['https://img1.jpg', 'https://img2.jpg']);
+      expect(urls).not.toBe(photos);
+      expect(photos).toHaveLength(3);
+    });
   });
 
   // ── buildSellerNote ────────────────────────────────────────────────────────
@@ -880,6 +928,26 @@ describe('Mercari Scraper Module', () => {
 
       expect(raw.postedAt).toEqual(new Date(createdTimestamp * 1000));
     });
+
+    it('derives seller rating and review count from the same rating totals', () => {
+      const item = createMercariItem({
+        seller: { id: 's1', name: 'Rated', ratings: { good: 8, normal: 1, bad: 1 } },
+      });
+      const raw = convertMercariToRawListing(item);
+
+      expect(raw.sellerReviewCount).toBe(10);
+      expect(raw.sellerRating).toBe(4.4);
+    });
+
+    it('returns null seller rating and review count when there are no ratings', () => {
+      const item = createMercariItem({
+        seller: { id: 's1', name: 'Fresh', ratings: { good: 0, normal: 0, bad: 0 } },
+      });
+      const raw = convertMercariToRawListing(item);
+
+      expect(raw.sellerRating).toBeNull();
+      expect(raw.sellerReviewCount).toBeNull();
+    });
   });
 
   // ── scrapeMercariWithPlaywright ────────────────────────────────────────────
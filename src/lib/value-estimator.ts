@@ -583,32 +583,33 @@ Thanks!`;
   }
 }
 
+// Patterns expanded 2026-04-15 via Story 13.7 refinement to reduce "other" misclassification
+// (was ~36% of items landing in default — now catches phones by brand, watches, chromebooks, etc.)
+// Built once at module load; order matters — detectCategory returns the first match
+const CATEGORY_PATTERNS: [string, RegExp][] = [
+  // Musical first - DJ equipment and instruments (before video games due to "controller")
+  ['musical', /guitar|piano|keyboard|drum|amplifier|instrument|\bdj\b|ddj|pioneer\s*ddj|saxophone|trumpet|violin|cello|\bbass\b|synth|synthesizer|\bmoog\b|\broland\b|\bkorg\b|\bakai\b|\bfender\b|\bgibson\b|\bmartin\b(?!\s+luther)|\bmarshall\b|mesa.?boogie|effects pedal|microphone|\bmic\b|\btaylor\b(?!\s+(swift|made))|\bovation\b|\bsquier\b|\bepiphone\b|\bibanez\b|\bprs\b|\bdbx\b|\bdrawmer\b|cajon|\bconga\b|pedals?\b/],
+  // Video games next - consoles and gaming (before electronics due to "console", "controller")
+  ['video games', /playstation|xbox|nintendo|\bgame\b|ps5|ps4|ps3|switch\b|\bwii\b|gamecube|atari|sega|retro console|arcade|joy-?con/],
+  // Electronics - general tech items (expanded with brands + product types)
+  [
+    'electronics',
+    /phone|iphone|ipad|airpods|galaxy|pixel\b|oneplus|laptop|computer|chromebook|thinkpad|macbook|tablet|\btv\b|monitor|camera|dslr|speaker|headphone|earbud|sound ?bar|\bwatch\b|smartwatch|apple watch|tv mount|projector|printer|\bram\b|\bssd\b|hard drive|router|modem|wifi|keyboard\s+(mechanical|gaming|wireless)|mouse\s+(wireless|gaming)|beats|bose|sonos|jbl|canon|nikon|sony\b|\brtx\b|\bgtx\b|geforce|radeon|\bimac\b|nighthawk|ubiquiti|unifi/,
+  ],
+  ['furniture', /couch|sofa|table|chair|desk|\bbed\b|dresser|cabinet|shelf|bookcase|nightstand|ottoman|stool|bench\b|wardrobe|armoire|aeron|herman miller|steelcase|restoration hardware|pottery barn|west elm|mid.?century|chippendale|eames|\bkartell\b|room\s*&?\s*board/],
+  ['appliances', /washer|dryer|refrigerator|fridge|dishwasher|microwave|oven|vacuum|blender|mixer|kitchenaid|vitamix|dyson|toaster|coffee ?maker|espresso|juicer|freezer|range\b|cooktop|stove|hood\b/],
+  ['tools', /drill|saw\b|wrench|hammer|power tool|dewalt|milwaukee|makita|snap.?on|ridgid|\brigid\b|craftsman|bosch|\bryobi\b|impact driver|miter|compressor|table saw|band saw|shop vac|tool set|tool box|greenlee|\bklein\b|chainsaw|generator|welder|grinder/],
+  ['collectibles', /vintage|antique|collectible|rare|limited|comic|\bcard\b|coin|stamp\b|\btoy\b|figurine|statue|memorabilia|signed\b|autograph|baseball\s+card/],
+  ['clothing', /shirt|pants|dress\b|shoes|jacket|coat\b|clothing|fashion|hoodie|sweater|boots?\b|sneakers|\bnike\b|adidas|north face|patagonia|\blevi\b/],
+  ['sports', /\bbike\b|bicycle|golf|tennis|fitness|\bgym\b|weights|treadmill|peloton|rowing|elliptical|kayak|\bski\b|snowboard|surfboard|helmet|football|basketball|soccer|baseball\s+(bat|glove)|\bping\b\s*(zing|anser|g\d|i\d)|cobra\s*king|taylormade|callaway|titleist|\bbow\b\s*(hunting|compound|archery)/],
+  ['automotive', /\bcar\b|truck|motorcycle|auto ?parts|\btire\b|wheel\b|engine\b|brake\b|exhaust|muffler|battery charger|floor jack/],
+];
+
 // Determine the best category based on title/description
 export function detectCategory(title: string, description: string | null): string {
   const fullText = `${title} ${description || ''}`.toLowerCase();
 
-  // Patterns expanded 2026-04-15 via Story 13.7 refinement to reduce "other" misclassification
-  // (was ~36% of items landing in default — now catches phones by brand, watches, chromebooks, etc.)
-  const categoryPatterns: [string, RegExp][] = [
-    // Musical first - DJ equipment and instruments (before video games due to "controller")
-    ['musical', /guitar|piano|keyboard|drum|amplifier|instrument|\bdj\b|ddj|pioneer\s*ddj|saxophone|trumpet|violin|cello|\bbass\b|synth|synthesizer|\bmoog\b|\broland\b|\bkorg\b|\bakai\b|\bfender\b|\bgibson\b|\bmartin\b(?!\s+luther)|\bmarshall\b|mesa.?boogie|effects pedal|microphone|\bmic\b|\btaylor\b(?!\s+(swift|made))|\bovation\b|\bsquier\b|\bepiphone\b|\bibanez\b|\bprs\b|\bdbx\b|\bdrawmer\b|cajon|\bconga\b|pedals?\b/],
-    // Video games next - consoles and gaming (before electronics due to "console", "controller")
-    ['video games', /playstation|xbox|nintendo|\bgame\b|ps5|ps4|ps3|switch\b|\bwii\b|gamecube|atari|sega|retro console|arcade|joy-?con/],
-    // Electronics - general tech items (expanded with brands + product types)
-    [
-      'electronics',
-      /phone|iphone|ipad|airpods|galaxy|pixel\b|oneplus|laptop|computer|chromebook|thinkpad|macbook|tablet|\btv\b|monitor|camera|dslr|speaker|headphone|earbud|sound ?bar|\bwatch\b|smartwatch|apple watch|tv mount|projector|printer|\bram\b|\bssd\b|hard drive|router|modem|wifi|keyboard\s+(mechanical|gaming|wireless)|mouse\s+(wireless|gaming)|beats|bose|sonos|jbl|canon|nikon|sony\b|\brtx\b|\bgtx\b|geforce|radeon|\bimac\b|nighthawk|ubiquiti|unifi/,
-    ],
-    ['furniture', /couch|sofa|table|chair|desk|\bbed\b|dresser|cabinet|shelf|bookcase|nightstand|ottoman|stool|bench\b|wardrobe|armoire|aeron|herman miller|steelcase|restoration hardware|pottery barn|west elm|mid.?century|chippendale|eames|\bkartell\b|room\s*&?\s*board/],
-    ['appliances', /washer|dryer|refrigerator|fridge|dishwasher|microwave|oven|vacuum|blender|mixer|kitchenaid|vitamix|dyson|toaster|coffee ?maker|espresso|juicer|freezer|range\b|cooktop|stove|hood\b/],
-    ['tools', /drill|saw\b|wrench|hammer|power tool|dewalt|milwaukee|makita|snap.?on|ridgid|\brigid\b|craftsman|bosch|\bryobi\b|impact driver|miter|compressor|table saw|band saw|shop vac|tool set|tool box|greenlee|\bklein\b|chainsaw|generator|welder|grinder/],
-    ['collectibles', /vintage|antique|collectible|rare|limited|comic|\bcard\b|coin|stamp\b|\btoy\b|figurine|statue|memorabilia|signed\b|autograph|baseball\s+card/],
-    ['clothing', /shirt|pants|dress\b|shoes|jacket|coat\b|clothing|fashion|hoodie|sweater|boots?\b|sneakers|\bnike\b|adidas|north face|patagonia|\blevi\b/],
-    ['sports', /\bbike\b|bicycle|golf|tennis|fitness|\bgym\b|weights|treadmill|peloton|rowing|elliptical|kayak|\bski\b|snowboard|surfboard|helmet|football|basketball|soccer|baseball\s+(bat|glove)|\bping\b\s*(zing|anser|g\d|i\d)|cobra\s*king|taylormade|callaway|titleist|\bbow\b\s*(hunting|compound|archery)/],
-    ['automotive', /\bcar\b|truck|motorcycle|auto ?parts|\btire\b|wheel\b|engine\b|brake\b|exhaust|muffler|battery charger|floor jack/],
-  ];
-
-  for (const [category, pattern] of categoryPatterns) {
+  for (const [category, pattern] of CATEGORY_PATTERNS) {
     if (pattern.test(fullText)) {
       return category;
     }
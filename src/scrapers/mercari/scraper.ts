@@ -96,6 +96,8 @@ function isRateLimitOrBlock(status: number, contentType: string | null): boolean
 
 /**
  * Makes a single request to Mercari's internal API (no retry logic)
+ * Connections are reused through fetch's shared keep-alive pool; the timeout
+ * stops a stalled socket from holding the retry loop open indefinitely
  */
 export async function callMercariApi(
   endpoint: string,
@@ -108,6 +110,7 @@ export async function callMercariApi(
     method,
     headers: buildMercariHeaders(),
     cache: 'no-store',
+    signal: AbortSignal.timeout(SCRAPER_CONFIG.API_TIMEOUT_MS),
   };
 
   if (body && method === 'POST') {
@@ -212,6 +215,11 @@ export async function scrapeMercariWithPlaywright(
         url?: string;
       }> = [];
 
+      // Compiled once per extraction rather than once per listing element
+      const itemIdPattern = /\/item\/([^/]+)/;
+      const pricePattern = /\$?([\d,]+(?:\.\d{1,2})?)/;
+      const thousandsSeparatorPattern = /,/g;
+
       // Try multiple selector patterns (Mercari UI changes)
       const selectors = [
         '[data-testid="ItemContainer"]',
@@ -233,7 +241,7 @@ export async function scrapeMercariWithPlaywright(
           // Extract URL and ID
           const linkEl = el.closest('a') || el.querySelector('a[href*="/item/"]');
           const href = (linkEl as HTMLAnchorElement)?.href || '';
-          const idMatch = href.match(/\/item\/([^/]+)/);
+          const idMatch = itemIdPattern.exec(href);
           const id = idMatch ? idMatch[1] : '';
 
           // Extract title
@@ -243,8 +251,8 @@ export async function scrapeMercariWithPlaywright(
           // Extract price
           const priceEl = el.querySelector('[class*="ItemPrice"], [data-testid="ItemPrice"]');
           const priceText = priceEl?.textContent || '';
-          const priceMatch = priceText.match(/\$?([\d,]+(?:\.\d{1,2})?)/);
-          const price = priceMatch ? parseFloat(priceMatch[1].replace(/,/g, '')) : 0;
+          const priceMatch = pricePattern.exec(priceText);
+          const price = priceMatch ? parseFloat(priceMatch[1].replace(thousandsSeparatorPattern, '')) : 0;
 
           // Extract image
           const imgEl = el.querySelector('img');
@@ -407,15 +415,9 @@ export function formatLocation(item: MercariItem): string | null {
  * Collects all image URLs from a Mercari item
  */
 export function collectImageUrls(item: MercariItem): string[] {
-  const urls: string[] = [];
-
-  if (item.photos?.length) {
-    urls.push(...item.photos);
-  } else if (item.thumbnails?.length) {
-    urls.push(...item.thumbnails);
-  }
-
-  return urls.filter(Boolean);
+  // Filter straight from the source array; filter() already returns a fresh copy
+  const source = item.photos?.length ? item.photos : item.thumbnails;
+  return source ? source.filter(Boolean) : [];
 }
 
 /**
@@ -440,7 +442,18 @@ export function buildSellerNote(item: MercariItem): string | null {
 export function computeMercariSellerRating(item: MercariItem): number | null {
   if (!item.seller?.ratings) return null;
   const { good = 0, normal = 0, bad = 0 } = item.seller.ratings;
-  const total = good + normal + bad;
+  return weightedSellerRating(good, normal, bad, good + normal + bad);
+}
+
+/**
+ * Weights good/normal/bad counts as 5/3/1 stars over a precomputed total
+ */
+function weightedSellerRating(
+  good: number,
+  normal: number,
+  bad: number,
+  total: number
+): number | null {
   if (total === 0) return null;
   const weighted = (good * 5 + normal * 3 + bad * 1) / total;
   return Math.round(weighted * 100) / 100;
@@ -451,10 +464,12 @@ export function computeMercariSellerRating(item: MercariItem): number | null {
  * for processing by marketplace-scanner.ts
  */
 export function convertMercariToRawListing(item: MercariItem): RawListing {
+  // Read and total the rating counts once for both sellerRating and sellerReviewCount
   const ratings = item.seller?.ratings;
-  const reviewTotal = ratings
-    ? (ratings.good ?? 0) + (ratings.normal ?? 0) + (ratings.bad ?? 0)
-    : 0;
+  const good = ratings?.good ?? 0;
+  const normal = ratings?.normal ?? 0;
+  const bad = ratings?.bad ?? 0;
+  const reviewTotal = good + normal + bad;
 
   return {
     externalId: item.id,
@@ -473,7 +488,7 @@ export function convertMercariToRawListing(item: MercariItem): RawListing {
       : item.updated
         ? new Date(item.updated * 1000)
         : null,
-    sellerRating: computeMercariSellerRating(item),
+    sellerRating: weightedSellerRating(good, normal, bad, reviewTotal),
     sellerReviewCount: reviewTotal > 0 ? reviewTotal : null,
     sellerAccountAgeDays: null, // Not available from Mercari API
   };
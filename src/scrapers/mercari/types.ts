@@ -57,6 +57,7 @@ export const USER_AGENTS = [
 export const SCRAPER_CONFIG = {
   MAX_RETRIES: 3,
   BACKOFF_BASE_MS: 1000,
+  API_TIMEOUT_MS: 10_000,
   NAVIGATION_TIMEOUT_MS: 30_000,
   SESSION_TIMEOUT_MS: 60_000,
   MIN_DELAY_MS: 500,